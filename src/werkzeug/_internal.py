@@ -24,11 +24,17 @@ _legal_cookie_chars = frozenset(
     c.encode("ascii")
     for c in f"{string.ascii_letters}{string.digits}/=!#$%&'*+-.^_`|~:"
 )
+_legal_cookie_chars_bytes = b"".join(sorted(_legal_cookie_chars))
 
 _cookie_quoting_map = {b",": b"\\054", b";": b"\\073", b'"': b'\\"', b"\\": b"\\\\"}
 for _i in chain(range(32), range(127, 256)):
     _cookie_quoting_map[_i.to_bytes(1, sys.byteorder)] = f"\\{_i:03o}".encode("latin1")
 
+# The quoted form of each byte, indexed by its value.
+_cookie_quoting_table = tuple(
+    _cookie_quoting_map.get(bytes((_i,)), bytes((_i,))) for _i in range(256)
+)
+
 _octal_re = re.compile(br"\\[0-3][0-7][0-7]")
 _quote_re = re.compile(br"[\\].")
 _legal_cookie_chars_re = br"[\w\d!#%&\'~_`><@,:/\$\*\+\-\.\^\|\)\(\?\}\{\=]"
@@ -95,6 +101,14 @@ _default_encoding = sys.getdefaultencoding()
 def _to_bytes(
     x: t.Union[str, bytes], charset: str = _default_encoding, errors: str = "strict"
 ) -> bytes:
+    # Exact type checks first for the common cases, subclasses and other
+    # buffer types are handled below.
+    if type(x) is bytes:
+        return x
+
+    if type(x) is str:
+        return x.encode(charset, errors)
+
     if x is None or isinstance(x, bytes):
         return x
 
@@ -128,7 +142,7 @@ def _to_str(
 
 
 def _to_str(x, charset=_default_encoding, errors="strict", allow_none_charset=False):
-    if x is None or isinstance(x, str):
+    if type(x) is str or x is None or isinstance(x, str):
         return x
 
     if not isinstance(x, (bytes, bytearray)):
@@ -395,21 +409,13 @@ class _DictAccessorProperty(t.Generic[_TAccessorValue]):
 
 
 def _cookie_quote(b: bytes) -> bytes:
-    buf = bytearray()
-    all_legal = True
-    _lookup = _cookie_quoting_map.get
-    _push = buf.extend
-
-    for char_int in b:
-        char = char_int.to_bytes(1, sys.byteorder)
-        if char not in _legal_cookie_chars:
-            all_legal = False
-            char = _lookup(char, char)
-        _push(char)
-
-    if all_legal:
-        return bytes(buf)
-    return bytes(b'"' + buf + b'"')
+    # Deleting all legal characters leaves nothing if no quoting is
+    # needed, which is the common case.
+    if not b.translate(None, _legal_cookie_chars_bytes):
+        return bytes(b)
+
+    table = _cookie_quoting_table
+    return b"".join([b'"', *[table[c] for c in b], b'"'])
 
 
 def _cookie_unquote(b: bytes) -> bytes:
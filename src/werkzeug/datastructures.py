@@ -832,6 +832,8 @@ def _options_header_vkw(value, kw):
 
 
 def _unicodify_header_value(value):
+    if type(value) is str:
+        return value
     if isinstance(value, bytes):
         value = value.decode("latin-1")
     if not isinstance(value, str):
@@ -1027,11 +1029,7 @@ class Headers:
             del self._list[key]
             return
         key = key.lower()
-        new = []
-        for k, v in self._list:
-            if k.lower() != key:
-                new.append((k, v))
-        self._list[:] = new
+        self._list[:] = [t for t in self._list if t[0].lower() != key]
 
     def remove(self, key):
         """Remove a key.
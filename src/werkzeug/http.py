@@ -10,6 +10,7 @@ from datetime import time
 from datetime import timedelta
 from datetime import timezone
 from enum import Enum
+from functools import lru_cache
 from hashlib import sha1
 from time import mktime
 from time import struct_time
@@ -109,6 +110,18 @@ _hop_by_hop_headers = frozenset(
         "upgrade",
     ]
 )
+# Common spellings of the header names above, checked before falling
+# back to lowercasing the name.
+_entity_headers_spellings = (
+    _entity_headers
+    | {h.title() for h in _entity_headers}
+    | {h.upper() for h in _entity_headers}
+)
+_hop_by_hop_headers_spellings = (
+    _hop_by_hop_headers
+    | {h.title() for h in _hop_by_hop_headers}
+    | {h.upper() for h in _hop_by_hop_headers}
+)
 HTTP_STATUS_CODES = {
     100: "Continue",
     101: "Switching Protocols",
@@ -643,12 +656,17 @@ def parse_authorization_header(
     """
     if not value:
         return None
-    value = _wsgi_decoding_dance(value)
-    try:
-        auth_type, auth_info = value.split(None, 1)
-        auth_type = auth_type.lower()
-    except ValueError:
-        return None
+    if value[:6] == "Basic ":
+        # Fast path for the most common spelling, the base64 data is
+        # ASCII so it doesn't need to be decoded first.
+        auth_type, auth_info = "basic", value[6:]
+    else:
+        value = _wsgi_decoding_dance(value)
+        try:
+            auth_type, auth_info = value.split(None, 1)
+            auth_type = auth_type.lower()
+        except ValueError:
+            return None
     if auth_type == "basic":
         try:
             username, password = base64.b64decode(auth_info).split(b":", 1)
@@ -1008,10 +1026,11 @@ def dump_age(age: t.Optional[t.Union[timedelta, int]] = None) -> t.Optional[str]
     """
     if age is None:
         return None
-    if isinstance(age, timedelta):
-        age = int(age.total_seconds())
-    else:
-        age = int(age)
+    if type(age) is not int:
+        if isinstance(age, timedelta):
+            age = int(age.total_seconds())
+        else:
+            age = int(age)
 
     if age < 0:
         raise ValueError("age cannot be negative")
@@ -1073,26 +1092,40 @@ def is_resource_modified(
     if modified_since and last_modified and last_modified <= modified_since:
         unmodified = True
 
-    if etag:
-        etag, _ = unquote_etag(etag)
-        etag = t.cast(str, etag)
+    if not etag:
+        return not unmodified
 
-        if if_range is not None and if_range.etag is not None:
-            unmodified = parse_etags(if_range.etag).contains(etag)
-        else:
-            if_none_match = parse_etags(environ.get("HTTP_IF_NONE_MATCH"))
-            if if_none_match:
-                # https://tools.ietf.org/html/rfc7232#section-3.2
-                # "A recipient MUST use the weak comparison function when comparing
-                # entity-tags for If-None-Match"
-                unmodified = if_none_match.contains_weak(etag)
-
-            # https://tools.ietf.org/html/rfc7232#section-3.1
-            # "Origin server MUST use the strong comparison function when
-            # comparing entity-tags for If-Match"
-            if_match = parse_etags(environ.get("HTTP_IF_MATCH"))
-            if if_match:
-                unmodified = not if_match.is_strong(etag)
+    if if_range is not None and if_range.etag is not None:
+        etag, _ = unquote_etag(etag)
+        unmodified = parse_etags(if_range.etag).contains(t.cast(str, etag))
+        return not unmodified
+
+    # Only parse the etag headers that were sent. Usually a request has
+    # at most one of them, or neither.
+    if_none_match_value = environ.get("HTTP_IF_NONE_MATCH")
+    if_match_value = environ.get("HTTP_IF_MATCH")
+
+    if not if_none_match_value and not if_match_value:
+        return not unmodified
+
+    etag, _ = unquote_etag(etag)
+    etag = t.cast(str, etag)
+
+    if if_none_match_value:
+        if_none_match = parse_etags(if_none_match_value)
+        if if_none_match:
+            # https://tools.ietf.org/html/rfc7232#section-3.2
+            # "A recipient MUST use the weak comparison function when comparing
+            # entity-tags for If-None-Match"
+            unmodified = if_none_match.contains_weak(etag)
+
+    if if_match_value:
+        # https://tools.ietf.org/html/rfc7232#section-3.1
+        # "Origin server MUST use the strong comparison function when
+        # comparing entity-tags for If-Match"
+        if_match = parse_etags(if_match_value)
+        if if_match:
+            unmodified = not if_match.is_strong(etag)
 
     return not unmodified
 
@@ -1144,7 +1177,7 @@ def is_entity_header(header: str) -> bool:
     :param header: the header to test.
     :return: `True` if it's an entity header, `False` otherwise.
     """
-    return header.lower() in _entity_headers
+    return header in _entity_headers_spellings or header.lower() in _entity_headers
 
 
 def is_hop_by_hop_header(header: str) -> bool:
@@ -1155,7 +1188,9 @@ def is_hop_by_hop_header(header: str) -> bool:
     :param header: the header to test.
     :return: `True` if it's an HTTP/1.1 "Hop-by-Hop" header, `False` otherwise.
     """
-    return header.lower() in _hop_by_hop_headers
+    return (
+        header in _hop_by_hop_headers_spellings or header.lower() in _hop_by_hop_headers
+    )
 
 
 def parse_cookie(
@@ -1200,11 +1235,15 @@ def parse_cookie(
         cls = ds.MultiDict
 
     def _parse_pairs():
+        # The parser always yields bytes, decode them directly instead of
+        # going through the type checks in _to_str.
         for key, val in _cookie_parse_impl(header):
-            key = _to_str(key, charset, errors, allow_none_charset=True)
+            if charset is not None:
+                key = key.decode(charset, errors)
             if not key:
                 continue
-            val = _to_str(val, charset, errors, allow_none_charset=True)
+            if charset is not None:
+                val = val.decode(charset, errors)
             yield key, val
 
     return cls(_parse_pairs())
@@ -1268,13 +1307,6 @@ def dump_cookie(
     key = _to_bytes(key, charset)
     value = _to_bytes(value, charset)
 
-    if path is not None:
-        from .urls import iri_to_uri
-
-        path = iri_to_uri(path, charset)
-
-    domain = _make_cookie_domain(domain)
-
     if isinstance(max_age, timedelta):
         max_age = int(max_age.total_seconds())
 
@@ -1284,46 +1316,26 @@ def dump_cookie(
     elif max_age is not None and sync_expires:
         expires = http_date(datetime.now(tz=timezone.utc).timestamp() + max_age)
 
-    if samesite is not None:
-        samesite = samesite.title()
-
-        if samesite not in {"Strict", "Lax", "None"}:
-            raise ValueError("SameSite must be 'Strict', 'Lax', or 'None'.")
-
-    buf = [key + b"=" + _cookie_quote(value)]
-
-    # XXX: In theory all of these parameters that are not marked with `None`
-    # should be quoted.  Because stdlib did not quote it before I did not
-    # want to introduce quoting there now.
-    for k, v, q in (
-        (b"Domain", domain, True),
-        (b"Expires", expires, False),
-        (b"Max-Age", max_age, False),
-        (b"Secure", secure, None),
-        (b"HttpOnly", httponly, None),
-        (b"Path", path, False),
-        (b"SameSite", samesite, False),
-    ):
-        if q is None:
-            if v:
-                buf.append(k)
-            continue
+    domain_attrs, attrs = _dump_cookie_attrs(
+        domain, secure, httponly, path, samesite, charset
+    )
+    buf = [key + b"=" + _cookie_quote(value), *domain_attrs]
 
+    # Expires usually changes between calls, so it and Max-Age are
+    # formatted each time.
+    for k, v in ((b"Expires", expires), (b"Max-Age", max_age)):
         if v is None:
             continue
 
-        tmp = bytearray(k)
         if not isinstance(v, (bytes, bytearray)):
             v = _to_bytes(str(v), charset)
-        if q:
-            v = _cookie_quote(v)
-        tmp += b"=" + v
-        buf.append(bytes(tmp))
+        buf.append(k + b"=" + v)
+
+    buf.extend(attrs)
 
     # The return value will be an incorrectly encoded latin1 header for
     # consistency with the headers object.
-    rv = b"; ".join(buf)
-    rv = rv.decode("latin1")
+    rv = b"; ".join(buf).decode("latin1")
 
     # Warn if the final value of the cookie is larger than the limit. If the
     # cookie is too large, then it may be silently ignored by the browser,
@@ -1344,6 +1356,58 @@ def dump_cookie(
     return rv
 
 
+@lru_cache(maxsize=128, typed=True)
+def _dump_cookie_attrs(
+    domain: t.Optional[str],
+    secure: bool,
+    httponly: bool,
+    path: t.Optional[str],
+    samesite: t.Optional[str],
+    charset: str,
+) -> t.Tuple[t.Tuple[bytes, ...], t.Tuple[bytes, ...]]:
+    """Format the ``Set-Cookie`` attributes that stay the same between
+    calls. Returns the ``Domain`` attribute and the ones that come after
+    ``Expires`` and ``Max-Age`` separately, so those two can be formatted
+    in between.
+    """
+    if path is not None:
+        path = iri_to_uri(path, charset)
+
+    domain = _make_cookie_domain(domain)
+
+    if samesite is not None:
+        samesite = samesite.title()
+
+        if samesite not in {"Strict", "Lax", "None"}:
+            raise ValueError("SameSite must be 'Strict', 'Lax', or 'None'.")
+
+    domain_attrs = () if domain is None else (b"Domain=" + _cookie_quote(domain),)
+    buf = []
+
+    # XXX: In theory all of these parameters that are not marked with `None`
+    # should be quoted.  Because stdlib did not quote it before I did not
+    # want to introduce quoting there now.
+    for k, v, q in (
+        (b"Secure", secure, None),
+        (b"HttpOnly", httponly, None),
+        (b"Path", path, False),
+        (b"SameSite", samesite, False),
+    ):
+        if q is None:
+            if v:
+                buf.append(k)
+            continue
+
+        if v is None:
+            continue
+
+        if not isinstance(v, (bytes, bytearray)):
+            v = _to_bytes(str(v), charset)
+        buf.append(k + b"=" + v)
+
+    return domain_attrs, tuple(buf)
+
+
 def is_byte_range_valid(
     start: t.Optional[int], stop: t.Optional[int], length: t.Optional[int]
 ) -> bool:
@@ -1351,16 +1415,15 @@ def is_byte_range_valid(
 
     .. versionadded:: 0.7
     """
-    if (start is None) != (stop is None):
-        return False
-    elif start is None:
-        return length is None or length >= 0
-    elif length is None:
-        return 0 <= start < stop  # type: ignore
-    elif start >= stop:  # type: ignore
+    if start is not None and stop is not None:
+        if length is None:
+            return 0 <= start < stop
+        return 0 <= start < stop and start < length
+    elif start is not None or stop is not None:
         return False
-    return 0 <= start < length
+    return length is None or length >= 0
 
 
 # circular dependencies
 from . import datastructures as ds
+from .urls import iri_to_uri
@@ -3,6 +3,7 @@ import typing as t
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from functools import lru_cache
 from http import HTTPStatus
 
 from .._internal import _to_str
@@ -34,6 +35,20 @@ from werkzeug.http import unquote_etag
 from werkzeug.utils import header_property
 
 
+# Status lines for integer status codes, built once instead of
+# formatting and uppercasing the reason phrase for every response.
+_status_lines = {
+    code: (f"{code} {msg.upper()}", code) for code, msg in HTTP_STATUS_CODES.items()
+}
+
+
+@lru_cache(maxsize=64)
+def _cached_content_type(mimetype: str, charset: str) -> str:
+    # Apps only use a handful of mimetypes, don't rebuild the content
+    # type for every response.
+    return get_content_type(mimetype, charset)
+
+
 def _set_property(name: str, doc: t.Optional[str] = None) -> property:
     def fget(self):
         def on_update(header_set):
@@ -125,7 +140,7 @@ class Response:
             if mimetype is None and "content-type" not in self.headers:
                 mimetype = self.default_mimetype
             if mimetype is not None:
-                mimetype = get_content_type(mimetype, self.charset)
+                mimetype = _cached_content_type(mimetype, self.charset)
             content_type = mimetype
         if content_type is not None:
             self.headers["Content-Type"] = content_type
@@ -160,6 +175,13 @@ class Response:
     def _clean_status(self, value: t.Union[str, int, HTTPStatus]) -> t.Tuple[str, int]:
         if isinstance(value, HTTPStatus):
             value = int(value)
+
+        if type(value) is int:
+            cached = _status_lines.get(value)
+
+            if cached is not None:
+                return cached
+
         status = _to_str(value, self.charset)
         split_status = status.split(None, 1)
 
@@ -177,6 +199,10 @@ class Response:
         if split_status[0].isdigit():
             # code only
             status_code = int(split_status[0])
+            cached = _status_lines.get(status_code)
+
+            if cached is not None:
+                return cached
 
             try:
                 status = f"{status_code} {HTTP_STATUS_CODES[status_code].upper()}"
@@ -300,7 +326,7 @@ class Response:
 
     @mimetype.setter
     def mimetype(self, value: str) -> None:
-        self.headers["Content-Type"] = get_content_type(value, self.charset)
+        self.headers["Content-Type"] = _cached_content_type(value, self.charset)
 
     @property
     def mimetype_params(self) -> t.Dict[str, str]:
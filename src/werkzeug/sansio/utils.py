@@ -83,16 +83,22 @@ def get_host(
 
     if host_header is not None:
         host = host_header
-    elif server is not None:
-        host = server[0]
 
-        if server[1] is not None:
-            host = f"{host}:{server[1]}"
+        if scheme in {"http", "ws"} and host.endswith(":80"):
+            host = host[:-3]
+        elif scheme in {"https", "wss"} and host.endswith(":443"):
+            host = host[:-4]
+    elif server is not None:
+        host, port = server
 
-    if scheme in {"http", "ws"} and host.endswith(":80"):
-        host = host[:-3]
-    elif scheme in {"https", "wss"} and host.endswith(":443"):
-        host = host[:-4]
+        # The port is already known as a number, only add it if it isn't
+        # the default rather than formatting it and stripping it again.
+        if not (
+            port is None
+            or (port == 80 and scheme in {"http", "ws"})
+            or (port == 443 and scheme in {"https", "wss"})
+        ):
+            host = f"{host}:{port}"
 
     if trusted_hosts is not None:
         if not host_is_trusted(host, trusted_hosts):
@@ -121,22 +127,17 @@ def get_current_url(
     :param path: The path part of the URL after ``root_path``.
     :param query_string: The portion of the URL after the "?".
     """
-    url = [scheme, "://", host]
-
     if root_path is None:
-        url.append("/")
-        return uri_to_iri("".join(url))
+        return uri_to_iri(f"{scheme}://{host}/")
 
-    url.append(url_quote(root_path.rstrip("/")))
-    url.append("/")
+    url = f"{scheme}://{host}{url_quote(root_path.rstrip('/'))}/"
 
     if path is None:
-        return uri_to_iri("".join(url))
+        return uri_to_iri(url)
 
-    url.append(url_quote(path.lstrip("/")))
+    url += url_quote(path.lstrip("/"))
 
     if query_string:
-        url.append("?")
-        url.append(url_quote(query_string, safe=":&%=+$!*'(),"))
+        url += "?" + url_quote(query_string, safe=":&%=+$!*'(),")
 
-    return uri_to_iri("".join(url))
+    return uri_to_iri(url)
@@ -28,7 +28,25 @@ if t.TYPE_CHECKING:
     from wsgiref.types import WSGIEnvironment
 
 
-def _warn_if_string(iterable: t.Iterable) -> None:
+_run_wsgi_app: t.Optional[t.Callable] = None
+
+
+def _get_run_wsgi_app() -> t.Callable:
+    """Import :func:`~werkzeug.test.run_wsgi_app` the first time it is
+    needed. It can't be imported at the top of the module because
+    ``werkzeug.test`` imports the response class.
+    """
+    global _run_wsgi_app
+
+    if _run_wsgi_app is None:
+        from ..test import run_wsgi_app
+
+        _run_wsgi_app = run_wsgi_app
+
+    return _run_wsgi_app
+
+
+def _warn_if_string(iterable: t.Iterable, stacklevel: int = 2) -> None:
     """Helper for the response objects to check if the iterable returned
     to the WSGI server is not a string.
     """
@@ -39,7 +57,7 @@ def _warn_if_string(iterable: t.Iterable) -> None:
             " client one character at a time. This is almost never"
             " intended behavior, use 'response.data' to assign strings"
             " to the response object.",
-            stacklevel=2,
+            stacklevel=stacklevel,
         )
 
 
@@ -47,17 +65,26 @@ def _iter_encoded(
     iterable: t.Iterable[t.Union[str, bytes]], charset: str
 ) -> t.Iterator[bytes]:
     for item in iterable:
-        if isinstance(item, str):
+        # Check for bytes exactly first, it's the most common item type.
+        # str subclasses such as Markup still need to be encoded.
+        if type(item) is bytes:
+            yield item
+        elif isinstance(item, str):
             yield item.encode(charset)
         else:
             yield item
 
 
+_accept_ranges_values = {True: "bytes", False: "none"}
+
+# Status codes that must not have a body: 1xx, 204, and 304.
+_no_body_statuses = frozenset(range(100, 200)) | {204, 304}
+
+
 def _clean_accept_ranges(accept_ranges: t.Union[bool, str]) -> str:
-    if accept_ranges is True:
-        return "bytes"
-    elif accept_ranges is False:
-        return "none"
+    # Only look up actual bools, 1 and 0 would match True and False.
+    if type(accept_ranges) is bool:
+        return _accept_ranges_values[accept_ranges]
     elif isinstance(accept_ranges, str):
         return accept_ranges
     raise ValueError("Invalid accept_ranges value")
@@ -153,15 +180,6 @@ class Response(_SansIOResponse):
     #: .. versionadded:: 0.8
     automatically_set_content_length = True
 
-    #: The response body to send as the WSGI iterable. A list of strings
-    #: or bytes represents a fixed-length response, any other iterable
-    #: is a streaming response. Strings are encoded to bytes as UTF-8.
-    #:
-    #: Do not set to a plain string or bytes, that will cause sending
-    #: the response to be very inefficient as it will iterate one byte
-    #: at a time.
-    response: t.Union[t.Iterable[str], t.Iterable[bytes]]
-
     def __init__(
         self,
         response: t.Optional[
@@ -202,6 +220,37 @@ class Response(_SansIOResponse):
         else:
             self.response = response
 
+    @property
+    def response(self) -> t.Union[t.Iterable[str], t.Iterable[bytes]]:
+        """The response body to send as the WSGI iterable. A list of
+        strings or bytes represents a fixed-length response, any other
+        iterable is a streaming response. Strings are encoded to bytes as
+        UTF-8.
+
+        Do not set to a plain string or bytes, that will cause sending
+        the response to be very inefficient as it will iterate one byte
+        at a time.
+        """
+        return self._response
+
+    @response.setter
+    def response(self, value: t.Union[t.Iterable[str], t.Iterable[bytes]]) -> None:
+        self._response = value
+
+        # Check once when the body is set rather than every time it is
+        # iterated. Point the warning at the code setting the body.
+        if __debug__:
+            _warn_if_string(value, stacklevel=3)
+
+        # is_sequence and is_streamed are checked often, work them out
+        # once when the body is set.
+        self._is_sequence = isinstance(value, (tuple, list))
+        # len() looks up __len__ on the type, check for it there rather
+        # than calling it and catching the error.
+        self._is_streamed = not self._is_sequence and not hasattr(
+            type(value), "__len__"
+        )
+
     def call_on_close(self, func: t.Callable[[], t.Any]) -> t.Callable[[], t.Any]:
         """Adds a function to the internal list of functions that should
         be called as part of closing down the response.  Since 0.7 this
@@ -215,7 +264,10 @@ class Response(_SansIOResponse):
 
     def __repr__(self) -> str:
         if self.is_sequence:
-            body_info = f"{sum(map(len, self.iter_encoded()))} bytes"
+            if all(type(x) is bytes for x in self.response):
+                body_info = f"{sum(map(len, self.response))} bytes"
+            else:
+                body_info = f"{sum(map(len, self.iter_encoded()))} bytes"
         else:
             body_info = "streamed" if self.is_streamed else "likely-streamed"
         return f"<{type(self).__name__} {body_info} [{self.status}]>"
@@ -258,9 +310,7 @@ class Response(_SansIOResponse):
                     " objects without an environ"
                 )
 
-            from ..test import run_wsgi_app
-
-            response = Response(*run_wsgi_app(response, environ))
+            response = Response(*_get_run_wsgi_app()(response, environ))
 
         response.__class__ = cls
         return response
@@ -281,9 +331,7 @@ class Response(_SansIOResponse):
         :param buffered: set to `True` to enforce buffering.
         :return: a response object.
         """
-        from ..test import run_wsgi_app
-
-        return cls(*run_wsgi_app(app, environ, buffered))
+        return cls(*_get_run_wsgi_app()(app, environ, buffered))
 
     @typing.overload
     def get_data(self, as_text: "te.Literal[False]" = False) -> bytes:
@@ -307,7 +355,12 @@ class Response(_SansIOResponse):
         .. versionadded:: 0.9
         """
         self._ensure_sequence()
-        rv = b"".join(self.iter_encoded())
+
+        if all(type(x) is bytes for x in self.response):
+            rv = b"".join(self.response)
+        else:
+            rv = b"".join(self.iter_encoded())
+
         if as_text:
             rv = rv.decode(self.charset)
         return rv
@@ -320,11 +373,12 @@ class Response(_SansIOResponse):
         .. versionadded:: 0.9
         """
         # if a string is set, it's encoded directly so that we
-        # can set the content length
-        if isinstance(value, str):
-            value = value.encode(self.charset)
-        else:
-            value = bytes(value)
+        # can set the content length. bytes are stored as is.
+        if type(value) is not bytes:
+            if isinstance(value, str):
+                value = value.encode(self.charset)
+            else:
+                value = bytes(value)
         self.response = [value]
         if self.automatically_set_content_length:
             self.headers["Content-Length"] = str(len(value))
@@ -341,6 +395,8 @@ class Response(_SansIOResponse):
             self._ensure_sequence()
         except RuntimeError:
             return None
+        if all(type(x) is bytes for x in self.response):
+            return sum(map(len, self.response))
         return sum(len(x) for x in self.iter_encoded())
 
     def _ensure_sequence(self, mutable: bool = False) -> None:
@@ -391,12 +447,15 @@ class Response(_SansIOResponse):
         value of this method is used as application iterator unless
         :attr:`direct_passthrough` was activated.
         """
-        if __debug__:
-            _warn_if_string(self.response)
+        response = self.response
+        # A single bytes item, as set by set_data, needs no encoding.
+        if type(response) is list and len(response) == 1:
+            if type(response[0]) is bytes:
+                return iter(response)
         # Encode in a separate function so that self.response is fetched
         # early.  This allows us to wrap the response with the return
         # value from get_app_iter or iter_encoded.
-        return _iter_encoded(self.response, self.charset)
+        return _iter_encoded(response, self.charset)
 
     @property
     def is_streamed(self) -> bool:
@@ -408,11 +467,7 @@ class Response(_SansIOResponse):
         This is useful for checking before applying some sort of post
         filtering that should not take place for streamed responses.
         """
-        try:
-            len(self.response)  # type: ignore
-        except (TypeError, AttributeError):
-            return True
-        return False
+        return self._is_streamed
 
     @property
     def is_sequence(self) -> bool:
@@ -422,7 +477,7 @@ class Response(_SansIOResponse):
 
         .. versionadded:: 0.6
         """
-        return isinstance(self.response, (tuple, list))
+        return self._is_sequence
 
     def close(self) -> None:
         """Close the wrapped response if possible.  You can also use the object
@@ -431,10 +486,14 @@ class Response(_SansIOResponse):
         .. versionadded:: 0.9
            Can now be used in a with statement.
         """
-        if hasattr(self.response, "close"):
-            self.response.close()  # type: ignore
-        for func in self._on_close:
-            func()
+        close = getattr(self.response, "close", None)
+
+        if close is not None:
+            close()
+
+        if self._on_close:
+            for func in self._on_close:
+                func()
 
     def __enter__(self) -> "Response":
         return self
@@ -460,9 +519,17 @@ class Response(_SansIOResponse):
             The ``Content-Length`` header is set.
         """
         # Always freeze the encoded response body, ignore
-        # implicit_sequence_conversion and direct_passthrough.
-        self.response = list(self.iter_encoded())
-        self.headers["Content-Length"] = str(sum(map(len, self.response)))
+        # implicit_sequence_conversion and direct_passthrough. Count the
+        # length while buffering instead of walking the list again.
+        response = []
+        length = 0
+
+        for chunk in self.iter_encoded():
+            response.append(chunk)
+            length += len(chunk)
+
+        self.response = response
+        self.headers["Content-Length"] = str(length)
 
         if no_etag is not None:
             warnings.warn(
@@ -476,14 +543,18 @@ class Response(_SansIOResponse):
 
     def get_wsgi_headers(self, environ: "WSGIEnvironment") -> Headers:
         """This is automatically called right before the response is started
-        and returns headers modified for the given environment.  It returns a
-        copy of the headers from the response with some modifications applied
-        if necessary.
+        and returns headers modified for the given environment.  If any
+        modifications are necessary, it returns a copy of the headers from
+        the response with those applied. Otherwise it returns the response's
+        own headers, which must not be modified.
 
         For example the location header (if present) is joined with the root
         URL of the environment.  Also the content length is automatically set
         to zero here for certain status codes.
 
+        .. versionchanged:: 2.0
+            The headers are only copied if they need to be modified.
+
         .. versionchanged:: 0.6
            Previously that function was called `fix_headers` and modified
            the response object in place.  Also since 0.6, IRIs in location
@@ -495,10 +566,9 @@ class Response(_SansIOResponse):
            encoded and the iterable is buffered.
 
         :param environ: the WSGI environment of the request.
-        :return: returns a new :class:`~werkzeug.datastructures.Headers`
+        :return: returns a :class:`~werkzeug.datastructures.Headers`
                  object.
         """
-        headers = Headers(self.headers)
         location: t.Optional[str] = None
         content_location: t.Optional[str] = None
         content_length: t.Optional[t.Union[str, int]] = None
@@ -507,7 +577,7 @@ class Response(_SansIOResponse):
         # iterate over the headers to find all values in one go.  Because
         # get_wsgi_headers is used each response that gives us a tiny
         # speedup.
-        for key, value in headers:
+        for key, value in self.headers:
             ikey = key.lower()
             if ikey == "location":
                 location = value
@@ -516,6 +586,28 @@ class Response(_SansIOResponse):
             elif ikey == "content-length":
                 content_length = value
 
+        # Most responses have a length set already and no URLs to fix,
+        # there's nothing else to do for them.
+        if (
+            location is None
+            and content_location is None
+            and content_length is not None
+            and 200 <= status < 300
+            and status != 204
+        ):
+            return self.headers
+
+        headers = self.headers
+
+        def writable() -> Headers:
+            # Only copy the headers the first time they are modified.
+            nonlocal headers
+
+            if headers is self.headers:
+                headers = Headers(self.headers)
+
+            return headers
+
         # make sure the location header is an absolute URL
         if location is not None:
             old_location = location
@@ -530,19 +622,20 @@ class Response(_SansIOResponse):
                     current_url = iri_to_uri(current_url)
                 location = url_join(current_url, location)
             if location != old_location:
-                headers["Location"] = location  # type: ignore
+                writable()["Location"] = location  # type: ignore
 
         # make sure the content location is a URL
         if content_location is not None and isinstance(content_location, str):
-            headers["Content-Location"] = iri_to_uri(content_location)
+            writable()["Content-Location"] = iri_to_uri(content_location)
 
-        if 100 <= status < 200 or status == 204:
+        if status == 304:
+            remove_entity_headers(writable())
+        elif status in _no_body_statuses:
             # Per section 3.3.2 of RFC 7230, "a server MUST NOT send a
             # Content-Length header field in any response with a status
             # code of 1xx (Informational) or 204 (No Content)."
-            headers.remove("Content-Length")
-        elif status == 304:
-            remove_entity_headers(headers)
+            if content_length is not None:
+                writable().remove("Content-Length")
 
         # if we can determine the content length automatically, we
         # should try to do that.  But only if this does not involve
@@ -553,17 +646,22 @@ class Response(_SansIOResponse):
             self.automatically_set_content_length
             and self.is_sequence
             and content_length is None
-            and status not in (204, 304)
-            and not (100 <= status < 200)
+            and status not in _no_body_statuses
         ):
-            try:
-                content_length = sum(len(_to_bytes(x, "ascii")) for x in self.response)
-            except UnicodeError:
-                # Something other than bytes, can't safely figure out
-                # the length of the response.
-                pass
+            if all(type(x) is bytes for x in self.response):
+                content_length = sum(map(len, self.response))
+                writable()["Content-Length"] = str(content_length)
             else:
-                headers["Content-Length"] = str(content_length)
+                try:
+                    content_length = sum(
+                        len(_to_bytes(x, "ascii")) for x in self.response
+                    )
+                except UnicodeError:
+                    # Something other than bytes, can't safely figure out
+                    # the length of the response.
+                    pass
+                else:
+                    writable()["Content-Length"] = str(content_length)
 
         return headers
 
@@ -582,15 +680,9 @@ class Response(_SansIOResponse):
         :return: a response iterable.
         """
         status = self.status_code
-        if (
-            environ["REQUEST_METHOD"] == "HEAD"
-            or 100 <= status < 200
-            or status in (204, 304)
-        ):
+        if environ["REQUEST_METHOD"] == "HEAD" or status in _no_body_statuses:
             iterable: t.Iterable[bytes] = ()
         elif self.direct_passthrough:
-            if __debug__:
-                _warn_if_string(self.response)
             return self.response  # type: ignore
         else:
             iterable = self.iter_encoded()
@@ -1,6 +1,3 @@
-from warnings import filterwarnings
-from warnings import resetwarnings
-
 import pytest
 
 from werkzeug import _internal as internal
@@ -44,13 +41,11 @@ def test_wrapper_internals():
     assert "Content-Length" in headers
 
     # check for internal warnings
-    filterwarnings("error", category=Warning)
     response = Response()
-    environ = create_environ()
-    response.response = "What the...?"
-    pytest.raises(Warning, lambda: list(response.iter_encoded()))
-    pytest.raises(Warning, lambda: list(response.get_app_iter(environ)))
-    response.direct_passthrough = True
-    pytest.raises(Warning, lambda: list(response.iter_encoded()))
-    pytest.raises(Warning, lambda: list(response.get_app_iter(environ)))
-    resetwarnings()
+
+    with pytest.warns(
+        UserWarning, match="Response iterable was set to a string"
+    ) as record:
+        response.response = "What the...?"
+
+    assert record[0].filename == __file__
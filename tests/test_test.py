@@ -1,6 +1,5 @@
 import json
 import sys
-from functools import partial
 from io import BytesIO
 
 import pytest
@@ -734,7 +733,7 @@ def test_run_wsgi_app_closing_iterator():
     assert status == "200 OK"
     assert list(headers) == [("Content-Type", "text/plain")]
     assert next(app_iter) == "bar"
-    pytest.raises(StopIteration, partial(next, app_iter))
+    pytest.raises(StopIteration, next, app_iter)
     app_iter.close()
 
     assert run_wsgi_app(bar, {}, True)[0] == ["bar"]
@@ -1188,6 +1188,22 @@ def test_urlfication():
     assert headers["content-location"] == "http://xn--n3h.net/"
 
 
+def test_wsgi_headers_copied_on_modification():
+    resp = wrappers.Response("Hello World!")
+    assert resp.get_wsgi_headers(create_environ()) is resp.headers
+
+    resp.headers["Location"] = "/test"
+    headers = resp.get_wsgi_headers(create_environ())
+    assert headers["Location"] == "http://localhost/test"
+    assert resp.headers["Location"] == "/test"
+
+
+def test_wsgi_headers_last_location_wins():
+    resp = wrappers.Response(headers=[("Location", "/a"), ("location", "/b")])
+    headers = resp.get_wsgi_headers(create_environ())
+    assert headers.getlist("Location") == ["http://localhost/b"]
+
+
 def test_new_response_iterator_behavior():
     req = wrappers.Request.from_values()
     resp = wrappers.Response("Hello Wörld!")
@@ -1425,7 +1441,7 @@ def test_malformed_204_response_has_no_content_length():
     env = create_environ()
     app_iter, status, headers = response.get_wsgi_response(env)
     assert status == "204 NO CONTENT"
-    assert "Content-Length" not in headers
+    assert "Content-Length" not in dict(headers)
     assert b"".join(app_iter) == b""  # ensure data will not be sent
 
 